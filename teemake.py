@@ -1,29 +1,40 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
 import subprocess
 import shutil
 import logging
-import time
+import functools
+import hashlib
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Union
-from dataclasses import dataclass
+from typing import ClassVar, Deque, IO, Mapping, Optional, Sequence, Tuple, List, Dict, Union
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 try:
     from rich.console import Console
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
     from rich.prompt import Prompt, Confirm
     from rich.table import Table
     from rich.text import Text
     from rich import box
+    from rich.markup import escape
 except ImportError:
     print("Error: Required package 'rich' not found.")
     print("Install it with: pip3 install rich")
     sys.exit(1)
 
+# Optional, used to cap build parallelism by available memory
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 console = Console()
 
 
@@ -36,6 +47,37 @@ class Style:
     INFO = "cyan"
     DIM = "dim"
     BOLD = "bold"
+    
+    # Precomputed markup tags for the single styles
+    SUCCESS_OPEN = f"[{SUCCESS}]"
+    SUCCESS_CLOSE = f"[/{SUCCESS}]"
+    ERROR_OPEN = f"[{ERROR}]"
+    ERROR_CLOSE = f"[/{ERROR}]"
+    WARNING_OPEN = f"[{WARNING}]"
+    WARNING_CLOSE = f"[/{WARNING}]"
+    INFO_OPEN = f"[{INFO}]"
+    INFO_CLOSE = f"[/{INFO}]"
+    DIM_OPEN = f"[{DIM}]"
+    DIM_CLOSE = f"[/{DIM}]"
+    
+    # Combined styles
+    INFO_BOLD = f"{INFO} {BOLD}"
+    WARNING_BOLD = f"{WARNING} {BOLD}"
+    SUCCESS_BOLD = f"{SUCCESS} {BOLD}"
+    ERROR_BOLD = f"{ERROR} {BOLD}"
+    WHITE_BOLD = f"white {BOLD}"
+    
+    # Precomputed markup tags for the combined styles
+    INFO_BOLD_OPEN = f"[{INFO_BOLD}]"
+    INFO_BOLD_CLOSE = f"[/{INFO_BOLD}]"
+    WARNING_BOLD_OPEN = f"[{WARNING_BOLD}]"
+    WARNING_BOLD_CLOSE = f"[/{WARNING_BOLD}]"
+    SUCCESS_BOLD_OPEN = f"[{SUCCESS_BOLD}]"
+    SUCCESS_BOLD_CLOSE = f"[/{SUCCESS_BOLD}]"
+    ERROR_BOLD_OPEN = f"[{ERROR_BOLD}]"
+    ERROR_BOLD_CLOSE = f"[/{ERROR_BOLD}]"
+    WHITE_BOLD_OPEN = f"[{WHITE_BOLD}]"
+    WHITE_BOLD_CLOSE = f"[/{WHITE_BOLD}]"
 
 
 class PackageManager(Enum):
@@ -48,16 +90,127 @@ class PackageManager(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Accepted spellings for boolean build option values
+_TRUTHY = frozenset({"ON", "YES", "TRUE", "1"})
+_FALSY = frozenset({"OFF", "NO", "FALSE", "0"})
+
+
+def _normalize_bool(value: str) -> Optional[str]:
+    """
+    Normalize a boolean-like string to "ON"/"OFF"
+
+    Args:
+        value: User-entered value
+
+    Returns:
+        "ON", "OFF" or None if the value is not a recognized boolean
+    """
+    upper = value.upper()
+    if upper in _TRUTHY:
+        return "ON"
+    if upper in _FALSY:
+        return "OFF"
+    return None
+
+
+# Server config keys written without quotes
+_NUMERIC_CONFIG_KEYS = frozenset({"sv_port", "sv_max_clients"})
+
+# Package manager probes, checked in order of preference
+_PM_PROBES: Tuple[Tuple[str, PackageManager], ...] = (
+    ('apt-get', PackageManager.APT),
+    ('dnf', PackageManager.DNF),
+    ('yum', PackageManager.YUM),
+    ('pacman', PackageManager.PACMAN),
+    ('zypper', PackageManager.ZYPPER),
+)
+
+# Resolved executable paths, keyed by command name
+_WHICH_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _which(cmd: str) -> Optional[str]:
+    """
+    Memoized shutil.which, so PATH is only scanned once per command
+
+    The usual /usr/bin location is tried first with a single access check
+    before falling back to a full PATH scan.
+
+    Args:
+        cmd: Command name to look up
+
+    Returns:
+        Full path to the executable or None if not found
+    """
+    if cmd not in _WHICH_CACHE:
+        usr_bin_path = f"/usr/bin/{cmd}"
+        if os.access(usr_bin_path, os.X_OK):
+            _WHICH_CACHE[cmd] = usr_bin_path
+        else:
+            _WHICH_CACHE[cmd] = shutil.which(cmd)
+    return _WHICH_CACHE[cmd]
+
+
+@functools.lru_cache(maxsize=4)
+def _disk_free_bytes(path: str) -> int:
+    """
+    Free disk space for a path, cached for the session
+
+    Args:
+        path: Path to check disk space on
+
+    Returns:
+        Free space in bytes
+    """
+    return shutil.disk_usage(path).free
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_package_manager_cached() -> PackageManager:
+    """
+    Detect the system's package manager once per process
+
+    The TEEMAKE_PM environment variable (e.g. "dnf") skips detection.
+
+    Returns:
+        PackageManager enum value
+    """
+    logger = logging.getLogger(__name__)
+
+    override = os.environ.get("TEEMAKE_PM")
+    if override:
+        try:
+            pm = PackageManager(override)
+            logger.debug(f"Using package manager from TEEMAKE_PM: {pm.value}")
+            return pm
+        except ValueError:
+            logger.warning(f"Ignoring unknown TEEMAKE_PM value: {override}")
+
+    for cmd, pm in _PM_PROBES:
+        if _which(cmd):
+            logger.debug(f"Detected package manager: {pm.value}")
+            return pm
+
+    logger.warning("Could not detect package manager")
+    return PackageManager.UNKNOWN
+
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class GameMode:
     """Represents a Teeworlds game mode configuration"""
     name: str
     url: str
-    dependencies: Dict[str, str]  # Package manager -> dependencies mapping
-    build_opts: List[str]  # Default build options
+    # Package manager -> dependencies mapping; read-only views are unhashable,
+    # so the hash covers the other fields
+    dependencies: Mapping[str, str] = field(hash=False)
+    build_opts: Tuple[str, ...]  # Default build options
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BuildOption:
     """Represents a CMake build option"""
     name: str
@@ -66,69 +219,70 @@ class BuildOption:
     option_type: str  # "boolean", "string", "generator"
     
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ConfigSetting:
     # Represents a configuration setting
     key: str
     prompt: str
     default: str
     description: str = ""
+    validator: Optional[Tuple[type, int, int]] = None  # (type, min, max) the value must satisfy
 
 
 class TeemakeBuilder:
     # Main class for building and managing Teeworlds servers
     
     # Game mode configurations
-    GAME_MODES: List[GameMode] = [
+    GAME_MODES: Tuple[GameMode, ...] = (
         GameMode(
             name="Teeworlds",
             url="https://github.com/teeworlds/teeworlds.git",
-            dependencies={
+            dependencies=MappingProxyType({
                 "apt-get": "libpnglite-dev libwavpack-dev",
                 "dnf": "libpng-devel wavpack-devel",
                 "yum": "libpng-devel wavpack-devel",
                 "pacman": "libpng wavpack",
                 "zypper": "libpng16-devel wavpack-devel",
-            },
-            build_opts=["cmake", "../source/", "-DCLIENT=OFF", "-DSERVER=ON"]
+            }),
+            build_opts=("cmake", "../source/", "-DCLIENT=OFF", "-DSERVER=ON")
         ),
         GameMode(
             name="DDNet",
             url="https://github.com/ddnet/ddnet.git",
-            dependencies={
+            dependencies=MappingProxyType({
                 "apt-get": "libvulkan-dev libsqlite3-dev libcurl4-openssl-dev",
                 "dnf": "vulkan-devel sqlite-devel libcurl-devel",
                 "yum": "vulkan-devel sqlite-devel libcurl-devel",
                 "pacman": "vulkan-icd-loader sqlite curl",
                 "zypper": "vulkan-devel sqlite3-devel libcurl-devel",
-            },
-            build_opts=["cmake", "../source/", "-DCLIENT=OFF", "-DSERVER=ON"]
+            }),
+            build_opts=("cmake", "../source/", "-DCLIENT=OFF", "-DSERVER=ON")
         ),
         GameMode(
             name="zCatch",
             url="https://github.com/jxsl13/zcatch.git",
-            dependencies={
+            dependencies=MappingProxyType({
                 "apt-get": "libcurl4-openssl-dev",
                 "dnf": "libcurl-devel",
                 "yum": "libcurl-devel",
                 "pacman": "curl",
                 "zypper": "libcurl-devel",
-            },
-            build_opts=["cmake", "../source/", "-DCLIENT=OFF", "-DSERVER=ON"]
+            }),
+            build_opts=("cmake", "../source/", "-DCLIENT=OFF", "-DSERVER=ON")
         ),
-    ]
+    )
     
     # Available build options for each game mode
-    AVAILABLE_BUILD_OPTIONS: Dict[str, List[BuildOption]] = {
-        "Teeworlds": [
+    AVAILABLE_BUILD_OPTIONS: Mapping[str, Tuple[BuildOption, ...]] = MappingProxyType({
+        "Teeworlds": (
             BuildOption("-DCLIENT", "Build client", "OFF", "boolean"),
             BuildOption("-DSERVER", "Build server", "ON", "boolean"),
             BuildOption("-DMASTERSERVER", "Build masterserver", "OFF", "boolean"),
             BuildOption("-DTOOLS", "Build tools", "OFF", "boolean"),
             BuildOption("-DDEV", "Development mode", "OFF", "boolean"),
             BuildOption("-GNinja", "Use Ninja build system (faster)", "OFF", "generator"),
-        ],
-        "DDNet": [
+        ),
+        "DDNet": (
             BuildOption("-DCLIENT", "Build client", "OFF", "boolean"),
             BuildOption("-DSERVER", "Build server", "ON", "boolean"),
             BuildOption("-DTOOLS", "Build tools", "OFF", "boolean"),
@@ -139,56 +293,94 @@ class TeemakeBuilder:
             BuildOption("-DSTEAM", "Enable Steam integration", "OFF", "boolean"),
             BuildOption("-DPREFER_BUNDLED_LIBS", "Use bundled libraries", "OFF", "boolean"),
             BuildOption("-GNinja", "Use Ninja build system (faster)", "OFF", "generator"),
-        ],
-        "zCatch": [
+        ),
+        "zCatch": (
             BuildOption("-DCLIENT", "Build client", "OFF", "boolean"),
             BuildOption("-DSERVER", "Build server", "ON", "boolean"),
             BuildOption("-DTOOLS", "Build tools", "OFF", "boolean"),
             BuildOption("-DDEV", "Development mode", "OFF", "boolean"),
             BuildOption("-GNinja", "Use Ninja build system (faster)", "OFF", "generator"),
-        ],
-    }
+        ),
+    })
     
     # Base dependencies for different package managers
-    BASE_DEPS: Dict[str, str] = {
+    BASE_DEPS: Mapping[str, str] = MappingProxyType({
         "apt-get": "build-essential cmake git python3 libfreetype6-dev libsdl2-dev",
         "dnf": "gcc gcc-c++ make cmake git python3 freetype-devel SDL2-devel",
         "yum": "gcc gcc-c++ make cmake git python3 freetype-devel SDL2-devel",
         "pacman": "base-devel cmake git python freetype2 sdl2",
         "zypper": "gcc gcc-c++ make cmake git python3 freetype2-devel libSDL2-devel",
-    }
+    })
+    
+    # Ninja package name for different package managers
+    NINJA_PACKAGES: Mapping[str, str] = MappingProxyType({
+        "apt-get": "ninja-build",
+        "dnf": "ninja-build",
+        "yum": "ninja-build",
+        "pacman": "ninja",
+        "zypper": "ninja",
+    })
+    
+    # Install command prefix and whether it needs sudo, per package manager
+    _INSTALL_CMDS: ClassVar[Mapping[PackageManager, Tuple[Tuple[str, ...], bool]]] = MappingProxyType({
+        PackageManager.APT: (("apt-get", "install", "-y"), True),
+        PackageManager.DNF: (("dnf", "install", "-y"), True),
+        PackageManager.YUM: (("yum", "install", "-y"), True),
+        PackageManager.PACMAN: (("pacman", "-S", "--noconfirm"), True),
+        PackageManager.ZYPPER: (("zypper", "install", "-y"), True),
+    })
+    
+    # Optional build tools looked up on PATH at startup
+    PROBED_TOOLS: Tuple[str, ...] = ("ninja", "ccache")
     
     # Minimum required disk space in MegaByte
     MIN_DISK_SPACE_MB = 2000
     
+    # File in the build directory recording the options of the last configure
+    CONFIGURE_HASH_FILE = ".teemake_opts_hash"
+    
+    # Number of trailing output lines kept from each command stream
+    OUTPUT_TAIL_LINES = 15
+    
+    # Allowed server (folder) names: alphanumeric, dash and underscore, 1-64 chars.
+    # The character class already rejects '/', '\' and '.', so path traversal
+    # needs no separate substring checks before matching.
+    _NAME_RE: ClassVar[re.Pattern] = re.compile(r'\A[A-Za-z0-9_-]{1,64}\Z')
+    
+    # One build option edit: "<option>=<value>" (spaces allowed around '=') or a bare token.
+    # A value is not taken from the next edit, so "6= 4=ON" is "6=" followed by "4=ON".
+    _OPTION_EDIT_RE: ClassVar[re.Pattern] = re.compile(
+        r'(?P<name>[^\s=]+)\s*=(?:\s*(?P<value>[^\s=]+)(?!\s*=))?|(?P<token>\S+)'
+    )
+    
     # Basic configuration settings for each game mode
-    BASIC_CONFIG_SETTINGS: Dict[str, List[ConfigSetting]] = {
-        "Teeworlds": [
+    BASIC_CONFIG_SETTINGS: Mapping[str, Tuple[ConfigSetting, ...]] = MappingProxyType({
+        "Teeworlds": (
             ConfigSetting("sv_name", "Server Name", "My Teeworlds Server", "The name of your server"),
-            ConfigSetting("sv_port", "Server Port", "8303", "Port number (default: 8303)"),
-            ConfigSetting("sv_max_clients", "Maximum Players", "16", "Maximum number of players"),
+            ConfigSetting("sv_port", "Server Port", "8303", "Port number (default: 8303)", (int, 1024, 65535)),
+            ConfigSetting("sv_max_clients", "Maximum Players", "16", "Maximum number of players", (int, 1, 256)),
             ConfigSetting("sv_gametype", "Game Type", "dm", "Game type (dm, tdm, ctf)"),
-        ],
-        "DDNet": [
+        ),
+        "DDNet": (
             ConfigSetting("sv_name", "Server Name", "My DDNet Server", "The name of your server"),
-            ConfigSetting("sv_port", "Server Port", "8303", "Port number (default: 8303)"),
-            ConfigSetting("sv_max_clients", "Maximum Players", "64", "Maximum number of players"),
+            ConfigSetting("sv_port", "Server Port", "8303", "Port number (default: 8303)", (int, 1024, 65535)),
+            ConfigSetting("sv_max_clients", "Maximum Players", "64", "Maximum number of players", (int, 1, 256)),
             ConfigSetting("sv_gametype", "Game Type", "DDraceNetwork", "Game type"),
-        ],
-        "zCatch": [
+        ),
+        "zCatch": (
             ConfigSetting("sv_name", "Server Name", "My zCatch Server", "The name of your server"),
-            ConfigSetting("sv_port", "Server Port", "8303", "Port number (default: 8303)"),
-            ConfigSetting("sv_max_clients", "Maximum Players", "16", "Maximum number of players"),
+            ConfigSetting("sv_port", "Server Port", "8303", "Port number (default: 8303)", (int, 1024, 65535)),
+            ConfigSetting("sv_max_clients", "Maximum Players", "16", "Maximum number of players", (int, 1, 256)),
             ConfigSetting("sv_gametype", "Game Type", "zCatch", "Game type"),
-        ],
-    }
+        ),
+    })
     
     # Advanced configuration settings (to be implemented later)
-    ADVANCED_CONFIG_SETTINGS: Dict[str, List[ConfigSetting]] = {
-        "Teeworlds": [],
-        "DDNet": [],
-        "zCatch": [],
-    }
+    ADVANCED_CONFIG_SETTINGS: Mapping[str, Tuple[ConfigSetting, ...]] = MappingProxyType({
+        "Teeworlds": (),
+        "DDNet": (),
+        "zCatch": (),
+    })
     
     def __init__(self, verbose: bool = False):
         """
@@ -201,8 +393,14 @@ class TeemakeBuilder:
         self.selected_mode: Optional[GameMode] = None
         self.verbose: bool = verbose
         self.is_root: bool = os.geteuid() == 0
+        # Pauses are skipped when not attached to a terminal (e.g. scripted or CI runs)
+        self._interactive: bool = sys.stdin.isatty() and sys.stdout.isatty()
         self._setup_logging()  # Setup logging FIRST
-        self.package_manager: PackageManager = self._detect_package_manager()
+        self.package_manager: PackageManager = _detect_package_manager_cached()
+        self._header_panel: Panel = self._build_header_panel()
+        self._deps_by_mode: Dict[str, Tuple[str, ...]] = {}
+        # Optional build tools, looked up once instead of per check
+        self._tools: Dict[str, Optional[str]] = {name: _which(name) for name in self.PROBED_TOOLS}
         
     def _setup_logging(self) -> None:
         """Setup logging configuration"""
@@ -216,35 +414,8 @@ class TeemakeBuilder:
         )
         self.logger = logging.getLogger(__name__)
         
-    def _detect_package_manager(self) -> PackageManager:
-        """
-        Detect the system's package manager
-        
-        Returns:
-            PackageManager enum value
-        """
-        package_managers = {
-            'apt-get': PackageManager.APT,
-            'dnf': PackageManager.DNF,
-            'yum': PackageManager.YUM,
-            'pacman': PackageManager.PACMAN,
-            'zypper': PackageManager.ZYPPER,
-        }
-        
-        for cmd, pm in package_managers.items():
-            if shutil.which(cmd):
-                self.logger.debug(f"Detected package manager: {pm.value}")
-                return pm
-        
-        self.logger.warning("Could not detect package manager")
-        return PackageManager.UNKNOWN
-        
-    def show_header(self, clear: bool = True) -> None:
-        """Display the application header"""
-        if clear:
-            # Use os.system for proper clearing across all terminals
-            os.system('clear' if os.name != 'nt' else 'cls')
-        
+    def _build_header_panel(self) -> Panel:
+        """Build the header panel once, it is reprinted on every screen clear"""
         header_art = """
   ████████╗███████╗███████╗███╗   ███╗ █████╗ ██╗  ██╗███████╗
   ╚══██╔══╝██╔════╝██╔════╝████╗ ████║██╔══██╗██║ ██╔╝██╔════╝
@@ -254,21 +425,27 @@ class TeemakeBuilder:
      ╚═╝   ╚══════╝╚══════╝╚═╝     ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
         """
         
-        console.print(Panel(
-            Text(header_art, style=f"{Style.INFO} {Style.BOLD}") + "\n" +
-            Text("Teemake - v2.0", style=f"white {Style.BOLD}") + 
+        return Panel(
+            Text(header_art, style=Style.INFO_BOLD) + "\n" +
+            Text("Teemake - v2.0", style=Style.WHITE_BOLD) + 
             Text(" | Created by efe", style="bright_black"),
             box=box.DOUBLE,
             border_style=Style.INFO,
             padding=(0, 2)
-        ))
+        )
+        
+    def show_header(self, clear: bool = True) -> None:
+        """Display the application header"""
+        if clear:
+            # Rich emits the clear sequence directly, no shell process needed
+            console.clear()
+        
+        console.print(self._header_panel)
         console.print()
     
     def clear_screen(self) -> None:
         """Clear the screen and show header"""
-        # Use os.system for proper clearing across all terminals
-        os.system('clear' if os.name != 'nt' else 'cls')
-        self.show_header(clear=False)
+        self.show_header(clear=True)
     
     def check_disk_space(self, path: Path = Path.cwd()) -> bool:
         """
@@ -281,12 +458,11 @@ class TeemakeBuilder:
             True if enough space available
         """
         try:
-            stat = shutil.disk_usage(path)
-            available_mb = stat.free / (1024 * 1024)
+            available_mb = _disk_free_bytes(str(path)) / (1024 * 1024)
             
             if available_mb < self.MIN_DISK_SPACE_MB:
                 console.print(
-                    f"[{Style.ERROR}]✗ Insufficient disk space[/{Style.ERROR}]"
+                    f"{Style.ERROR_OPEN}✗ Insufficient disk space{Style.ERROR_CLOSE}"
                 )
                 console.print(
                     f"  Required: {self.MIN_DISK_SPACE_MB}MB, "
@@ -295,8 +471,8 @@ class TeemakeBuilder:
                 return False
             
             console.print(
-                f"[{Style.SUCCESS}]✓ Disk space check passed "
-                f"({available_mb:.0f}MB available)[/{Style.SUCCESS}]"
+                f"{Style.SUCCESS_OPEN}✓ Disk space check passed "
+                f"({available_mb:.0f}MB available){Style.SUCCESS_CLOSE}"
             )
             return True
             
@@ -313,7 +489,7 @@ class TeemakeBuilder:
         """
         # If already root, no sudo needed
         if self.is_root:
-            console.print(f"[{Style.SUCCESS}]✓ Running as root[/{Style.SUCCESS}]")
+            console.print(f"{Style.SUCCESS_OPEN}✓ Running as root{Style.SUCCESS_CLOSE}")
             return True
         
         # Check if sudo is cached
@@ -325,37 +501,113 @@ class TeemakeBuilder:
             )
             if result.returncode == 0:
                 console.print(
-                    f"[{Style.SUCCESS}]✓ Sudo privileges detected (cached)[/{Style.SUCCESS}]"
+                    f"{Style.SUCCESS_OPEN}✓ Sudo privileges detected (cached){Style.SUCCESS_CLOSE}"
                 )
                 return True
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
         console.print(
-            f"[{Style.WARNING}]Sudo privileges required for dependencies[/{Style.WARNING}]"
+            f"{Style.WARNING_OPEN}Sudo privileges required for dependencies{Style.WARNING_CLOSE}"
         )
         
         try:
             result = subprocess.run(["sudo", "-v"], timeout=30)
             if result.returncode == 0:
-                console.print(f"[{Style.SUCCESS}]✓ Sudo access granted[/{Style.SUCCESS}]")
+                console.print(f"{Style.SUCCESS_OPEN}✓ Sudo access granted{Style.SUCCESS_CLOSE}")
                 return True
             else:
-                console.print(f"[{Style.ERROR}]✗ Authentication failed[/{Style.ERROR}]")
+                console.print(f"{Style.ERROR_OPEN}✗ Authentication failed{Style.ERROR_CLOSE}")
                 return False
         except subprocess.TimeoutExpired:
-            console.print(f"[{Style.ERROR}]✗ Authentication timeout[/{Style.ERROR}]")
+            console.print(f"{Style.ERROR_OPEN}✗ Authentication timeout{Style.ERROR_CLOSE}")
             return False
         except KeyboardInterrupt:
-            console.print(f"\n[{Style.ERROR}]✗ Authentication cancelled[/{Style.ERROR}]")
+            console.print(f"\n{Style.ERROR_OPEN}✗ Authentication cancelled{Style.ERROR_CLOSE}")
             return False
     
+    def _stream_command(
+        self,
+        command: Union[Sequence[str], str],
+        shell: bool = False,
+        cwd: Optional[Path] = None,
+        timeout: Optional[float] = None,
+        echo: bool = False,
+        merge_output: bool = False
+    ) -> Tuple[int, Deque[str], Deque[str]]:
+        """
+        Run a command, reading its output line by line as it is produced
+        
+        Only the last OUTPUT_TAIL_LINES lines of each stream are retained,
+        so large build logs are never held in memory as a whole.
+        
+        Args:
+            command: Command to run
+            shell: Whether to use shell
+            cwd: Working directory for command
+            timeout: Seconds to wait before killing the command
+            echo: Print each line to the console as it arrives
+            merge_output: Send stderr into stdout and read them as one stream,
+                whose tail is returned as the stderr tail
+            
+        Returns:
+            Tuple of (return code, stdout tail, stderr tail)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeded the timeout
+        """
+        process = subprocess.Popen(
+            command,
+            shell=shell,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_output else subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            errors='replace'
+        )
+        stdout_tail: Deque[str] = deque(maxlen=self.OUTPUT_TAIL_LINES)
+        stderr_tail: Deque[str] = deque(maxlen=self.OUTPUT_TAIL_LINES)
+        
+        def pump(stream: IO[str], tail: Deque[str], style: Optional[str]) -> None:
+            with stream:
+                for line in stream:
+                    line = line.rstrip('\n')
+                    tail.append(line)
+                    if echo:
+                        console.print(line, style=style, markup=False, highlight=False)
+        
+        if merge_output:
+            readers = [
+                threading.Thread(target=pump, args=(process.stdout, stderr_tail, None), daemon=True),
+            ]
+        else:
+            readers = [
+                threading.Thread(target=pump, args=(process.stdout, stdout_tail, None), daemon=True),
+                threading.Thread(target=pump, args=(process.stderr, stderr_tail, Style.WARNING), daemon=True),
+            ]
+        for reader in readers:
+            reader.start()
+        
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+        
+        return returncode, stdout_tail, stderr_tail
+    
     def run_command(
         self, 
         description: str, 
-        command: Union[List[str], str],
+        command: Union[Sequence[str], str],
         shell: bool = False,
-        cwd: Optional[Path] = None
+        cwd: Optional[Path] = None,
+        capture: bool = True
     ) -> Tuple[bool, str, str]:
         """
         Run a command with progress indication
@@ -365,31 +617,35 @@ class TeemakeBuilder:
             command: Command to run (list preferred for safety)
             shell: Whether to use shell (avoid if possible)
             cwd: Working directory for command
+            capture: Keep stdout separately. When False, verbose mode hands
+                the terminal straight to the command, and quiet mode keeps
+                only the tail of the combined output for error reporting
             
         Returns:
-            Tuple of (success, stdout, stderr)
+            Tuple of (success, stdout, stderr), where stdout and stderr
+            hold only the trailing lines of each stream
         """
         self.logger.debug(f"Running command: {command}")
         
         if self.verbose:
-            console.print(f"\n[{Style.INFO}]ℹ[/{Style.INFO}] {description}")
-            console.print(f"[{Style.DIM}]Running: {command}[/{Style.DIM}]\n")
+            console.print(f"\n{Style.INFO_OPEN}ℹ{Style.INFO_CLOSE} {description}")
+            console.print(f"{Style.DIM_OPEN}Running: {command}{Style.DIM_CLOSE}\n")
             
-            result = subprocess.run(
+            if not capture:
+                result = subprocess.run(command, shell=shell, cwd=cwd)
+                return result.returncode == 0, "", ""
+            
+            returncode, stdout_tail, stderr_tail = self._stream_command(
                 command,
                 shell=shell,
-                text=True,
                 cwd=cwd,
-                capture_output=True,
-                errors='replace'
+                echo=True
             )
             
-            if result.stdout:
-                console.print(result.stdout)
-            if result.stderr:
-                console.print(f"[{Style.WARNING}]{result.stderr}[/{Style.WARNING}]")
-            
-            return result.returncode == 0, result.stdout, result.stderr
+            return returncode == 0, "\n".join(stdout_tail), "\n".join(stderr_tail)
+        
+        # rich.progress is the heaviest rich module and only needed once building starts
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
         
         with Progress(
             SpinnerColumn(),
@@ -401,43 +657,40 @@ class TeemakeBuilder:
             task = progress.add_task(description, total=None)
             
             try:
-                result = subprocess.run(
+                returncode, stdout_tail, stderr_tail = self._stream_command(
                     command,
                     shell=shell,
-                    capture_output=True,
-                    text=True,
                     cwd=cwd,
                     timeout=3600,  # 1 hour timeout
-                    errors='replace'
+                    merge_output=not capture
                 )
                 
                 progress.update(task, completed=True)
                 
-                if result.returncode == 0:
-                    console.print(f"[{Style.SUCCESS}]✓ {description}[/{Style.SUCCESS}]")
-                    return True, result.stdout, result.stderr
+                if returncode == 0:
+                    console.print(f"{Style.SUCCESS_OPEN}✓ {description}{Style.SUCCESS_CLOSE}")
+                    return True, "\n".join(stdout_tail), "\n".join(stderr_tail)
                 else:
-                    console.print(f"[{Style.ERROR}]✗ {description}[/{Style.ERROR}]")
-                    console.print(f"\n[{Style.ERROR}]Error output:[/{Style.ERROR}]")
+                    console.print(f"{Style.ERROR_OPEN}✗ {description}{Style.ERROR_CLOSE}")
+                    console.print(f"\n{Style.ERROR_OPEN}Error output:{Style.ERROR_CLOSE}")
                     
                     # Show relevant error lines
-                    error_lines = result.stderr.split('\n') if result.stderr else []
-                    for line in error_lines[-15:]:  # Last 15 lines
+                    for line in stderr_tail:
                         if line.strip():
-                            console.print(f"  [{Style.DIM}]{line}[/{Style.DIM}]")
+                            console.print(f"  {Style.DIM_OPEN}{line}{Style.DIM_CLOSE}")
                     
-                    return False, result.stdout, result.stderr
+                    return False, "\n".join(stdout_tail), "\n".join(stderr_tail)
                     
             except subprocess.TimeoutExpired:
                 progress.update(task, completed=True)
                 console.print(
-                    f"[{Style.ERROR}]✗ {description} (timeout)[/{Style.ERROR}]"
+                    f"{Style.ERROR_OPEN}✗ {description} (timeout){Style.ERROR_CLOSE}"
                 )
                 return False, "", "Command timed out after 1 hour"
             except Exception as e:
                 progress.update(task, completed=True)
-                console.print(f"[{Style.ERROR}]✗ {description}[/{Style.ERROR}]")
-                console.print(f"[{Style.ERROR}]Exception: {str(e)}[/{Style.ERROR}]")
+                console.print(f"{Style.ERROR_OPEN}✗ {description}{Style.ERROR_CLOSE}")
+                console.print(f"{Style.ERROR_OPEN}Exception: {str(e)}{Style.ERROR_CLOSE}")
                 return False, "", str(e)
     
     def validate_server_name(self, name: str) -> bool:
@@ -450,21 +703,19 @@ class TeemakeBuilder:
         Returns:
             True if valid
         """
-        import re
-        
-        # Check for path traversal attempts
-        if '..' in name or '/' in name or '\\' in name:
-            return False
-        
-        # Check alphanumeric with dash and underscore
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
-            return False
+        return bool(self._NAME_RE.fullmatch(name))
+    
+    def _pause(self, message: str) -> None:
+        """
+        Show a message and wait for Enter, skipped in non-interactive runs
         
-        # Check length (reasonable limits)
-        if len(name) < 1 or len(name) > 64:
-            return False
-            
-        return True
+        Args:
+            message: Text shown before waiting
+        """
+        if not self._interactive:
+            return
+        console.print(f"{Style.INFO_OPEN}{message}{Style.INFO_CLOSE}")
+        input()
     
     def get_server_name(self) -> str:
         """
@@ -473,23 +724,22 @@ class TeemakeBuilder:
         Returns:
             Validated server name
         """
+        # Draw the step once, invalid attempts re-prompt below the error
+        self.clear_screen()
+        console.print(f"{Style.INFO_BOLD_OPEN}Step 1/5: Folder Name{Style.INFO_BOLD_CLOSE}\n")
+        
         while True:
-            self.clear_screen()
-            console.print(f"[{Style.INFO} {Style.BOLD}]Step 1/5: Folder Name[/{Style.INFO} {Style.BOLD}]\n")
-            
             name = Prompt.ask(
-                f"[{Style.WARNING} {Style.BOLD}]Enter Folder Name[/{Style.WARNING} {Style.BOLD}]",
+                f"{Style.WARNING_BOLD_OPEN}Enter Folder Name{Style.WARNING_BOLD_CLOSE}",
             )
             
             if self.validate_server_name(name):
                 return name
             
             console.print(
-                f"\n[{Style.ERROR}]Invalid name. Use alphanumeric characters, - or _ only "
-                f"(1-64 chars, no path separators).[/{Style.ERROR}]"
+                f"{Style.ERROR_OPEN}Invalid name. Use alphanumeric characters, - or _ only "
+                f"(1-64 chars, no path separators).{Style.ERROR_CLOSE}\n"
             )
-            console.print(f"\n[{Style.INFO}]Press Enter to try again...[/{Style.INFO}]")
-            input()
     
     def select_game_mode(self) -> GameMode:
         """
@@ -498,34 +748,35 @@ class TeemakeBuilder:
         Returns:
             Selected GameMode
         """
+        # Draw the step once, invalid choices re-prompt below the error
+        self.clear_screen()
+        console.print(f"{Style.INFO_BOLD_OPEN}Step 2/5: Game Mode Selection{Style.INFO_BOLD_CLOSE}\n")
+        console.print(f"{Style.WHITE_BOLD_OPEN}Available Game Modes:{Style.WHITE_BOLD_CLOSE}\n")
+        
+        table = Table(show_header=True, header_style=Style.INFO_BOLD, box=box.ROUNDED)
+        table.add_column("#", style=Style.INFO, width=4)
+        table.add_column("Mode", style=Style.WHITE_BOLD)
+        table.add_column("Description", style=Style.DIM)
+        
+        descriptions: Dict[str, str] = {
+            "Teeworlds": "Classic Teeworlds",
+            "DDNet": "Advanced race mode ",
+            "zCatch": "Pvp catch mode"
+        }
+        
+        for idx, mode in enumerate(self.GAME_MODES, 1):
+            table.add_row(
+                str(idx),
+                mode.name,
+                descriptions.get(mode.name, "")
+            )
+        
+        console.print(table)
+        console.print()
+        
         while True:
-            self.clear_screen()
-            console.print(f"[{Style.INFO} {Style.BOLD}]Step 2/5: Game Mode Selection[/{Style.INFO} {Style.BOLD}]\n")
-            console.print(f"[white {Style.BOLD}]Available Game Modes:[/white {Style.BOLD}]\n")
-            
-            table = Table(show_header=True, header_style=f"{Style.INFO} {Style.BOLD}", box=box.ROUNDED)
-            table.add_column("#", style=Style.INFO, width=4)
-            table.add_column("Mode", style=f"white {Style.BOLD}")
-            table.add_column("Description", style=Style.DIM)
-            
-            descriptions: Dict[str, str] = {
-                "Teeworlds": "Classic Teeworlds",
-                "DDNet": "Advanced race mode ",
-                "zCatch": "Pvp catch mode"
-            }
-            
-            for idx, mode in enumerate(self.GAME_MODES, 1):
-                table.add_row(
-                    str(idx),
-                    mode.name,
-                    descriptions.get(mode.name, "")
-                )
-            
-            console.print(table)
-            console.print()
-            
             choice = Prompt.ask(
-                f"[{Style.WARNING}]Select a mode (1-{len(self.GAME_MODES)})[/{Style.WARNING}]",
+                f"{Style.WARNING_OPEN}Select a mode (1-{len(self.GAME_MODES)}){Style.WARNING_CLOSE}",
             )
             
             try:
@@ -535,11 +786,9 @@ class TeemakeBuilder:
             except ValueError:
                 pass
             
-            console.print(f"\n[{Style.ERROR}]Invalid choice. Please try again.[/{Style.ERROR}]")
-            console.print(f"\n[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-            input()
+            console.print(f"{Style.ERROR_OPEN}Invalid choice. Please try again.{Style.ERROR_CLOSE}\n")
     
-    def customize_build_options(self) -> Tuple[List[str], bool]:
+    def customize_build_options(self) -> Tuple[Sequence[str], bool]:
         """
         Allow user to customize build options for selected game mode
         
@@ -547,69 +796,91 @@ class TeemakeBuilder:
             Tuple of (build command arguments, use_ninja flag)
         """
         self.clear_screen()
-        console.print(f"[{Style.INFO} {Style.BOLD}]Step 3/5: Build Options[/{Style.INFO} {Style.BOLD}]\n")
+        console.print(f"{Style.INFO_BOLD_OPEN}Step 3/5: Build Options{Style.INFO_BOLD_CLOSE}\n")
+        
+        # Ninja is used by default whenever it is installed
+        ninja_available = self._tools["ninja"] is not None
+        default_build = (
+            ((*self.selected_mode.build_opts, "-GNinja"), True) if ninja_available
+            else (self.selected_mode.build_opts, False)
+        )
         
         # Ask if user wants to customize
         if not Confirm.ask(
-            f"[{Style.WARNING}]Do you want to customize build options?[/{Style.WARNING}]",
+            f"{Style.WARNING_OPEN}Do you want to customize build options?{Style.WARNING_CLOSE}",
             default=False
         ):
-            console.print(f"\n[{Style.INFO}]✓ Using default build options[/{Style.INFO}]")
-            return self.selected_mode.build_opts.copy(), False
+            console.print(f"\n{Style.INFO_OPEN}✓ Using default build options{Style.INFO_CLOSE}")
+            return default_build
         
         # Get available options for this game mode
-        available_options = self.AVAILABLE_BUILD_OPTIONS.get(self.selected_mode.name, [])
+        available_options = self.AVAILABLE_BUILD_OPTIONS.get(self.selected_mode.name, ())
         
         if not available_options:
             console.print(
-                f"\n[{Style.WARNING}]No customizable options available for {self.selected_mode.name}[/{Style.WARNING}]"
+                f"\n{Style.WARNING_OPEN}No customizable options available for {self.selected_mode.name}{Style.WARNING_CLOSE}"
             )
-            console.print(f"\n[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-            input()
-            return self.selected_mode.build_opts.copy(), False
+            self._pause("\nPress Enter to continue...")
+            return default_build
         
+        # Starting values: the option defaults, with Ninja switched on if installed
+        initial_values = {
+            opt.name: "ON" if opt.name == "-GNinja" and ninja_available else opt.current_value
+            for opt in available_options
+        }
         # Create a copy of options to track current values
-        current_options = {opt.name: opt.current_value for opt in available_options}
-        use_ninja = False
+        current_options = dict(initial_values)
+        options_by_name = {opt.name: opt for opt in available_options}
+        # Row labels never change, only the "Current" column is recomputed per redraw
+        option_rows = [(str(idx), opt) for idx, opt in enumerate(available_options, 1)]
+        # Confirmations of the previous edits, shown above the re-rendered table
+        last_actions: List[str] = []
         
         while True:
             self.clear_screen()
-            console.print(f"[{Style.INFO} {Style.BOLD}]Step 3/5: Build Options Customization[/{Style.INFO} {Style.BOLD}]\n")
+            console.print(f"{Style.INFO_BOLD_OPEN}Step 3/5: Build Options Customization{Style.INFO_BOLD_CLOSE}\n")
+            
+            if last_actions:
+                for action in last_actions:
+                    console.print(f"{Style.SUCCESS_OPEN}{action}{Style.SUCCESS_CLOSE}")
+                console.print()
+                last_actions.clear()
             
             # Display available options with current values
-            console.print(f"[white {Style.BOLD}]Available Build Options:[/white {Style.BOLD}]\n")
+            console.print(f"{Style.WHITE_BOLD_OPEN}Available Build Options:{Style.WHITE_BOLD_CLOSE}\n")
             
-            table = Table(show_header=True, header_style=f"{Style.INFO} {Style.BOLD}", box=box.ROUNDED)
+            table = Table(show_header=True, header_style=Style.INFO_BOLD, box=box.ROUNDED)
             table.add_column("#", style=Style.INFO, width=4)
-            table.add_column("Option", style=f"white {Style.BOLD}", width=20)
+            table.add_column("Option", style=Style.WHITE_BOLD, width=20)
             table.add_column("Description", style=Style.DIM, width=35)
             table.add_column("Current", style=Style.SUCCESS, width=10)
             
-            for idx, opt in enumerate(available_options, 1):
+            for row_label, opt in option_rows:
                 # Get current value (may have been changed)
-                current_val = current_options.get(opt.name, opt.current_value)
+                current_val = current_options[opt.name]
                 
                 # Highlight changed values
-                if current_val != opt.current_value:
-                    value_display = f"[{Style.SUCCESS} {Style.BOLD}]{current_val}[/{Style.SUCCESS} {Style.BOLD}]"
+                if current_val != initial_values[opt.name]:
+                    value_display = f"{Style.SUCCESS_BOLD_OPEN}{current_val}{Style.SUCCESS_BOLD_CLOSE}"
                 else:
                     value_display = current_val
                 
-                table.add_row(str(idx), opt.name, opt.description, value_display)
+                table.add_row(row_label, opt.name, opt.description, value_display)
             
             console.print(table)
             console.print()
             
             # Instructions
-            console.print(f"[{Style.INFO}]Instructions:[/{Style.INFO}]")
-            console.print(f"  • Use number: [white {Style.BOLD}]<#>=<value>[/white {Style.BOLD}] → Example: [white]1=ON[/white]")
-            console.print(f"  • Use name: [white {Style.BOLD}]<option>=<value>[/white {Style.BOLD}] → Example: [white]-DMYSQL=ON[/white]")
-            console.print(f"  • For Ninja: [white {Style.BOLD}]<#>=ON/OFF[/white {Style.BOLD}] or [white]-GNinja[/white]")
-            console.print(f"  • Type [white {Style.BOLD}]done[/white {Style.BOLD}] when finished\n")
+            console.print(f"{Style.INFO_OPEN}Instructions:{Style.INFO_CLOSE}")
+            console.print(f"  • Use number: {Style.WHITE_BOLD_OPEN}<#>=<value>{Style.WHITE_BOLD_CLOSE} → Example: [white]1=ON[/white]")
+            console.print(f"  • Use name: {Style.WHITE_BOLD_OPEN}<option>=<value>{Style.WHITE_BOLD_CLOSE} → Example: [white]-DMYSQL=ON[/white]")
+            console.print(f"  • For Ninja: {Style.WHITE_BOLD_OPEN}<#>=ON/OFF{Style.WHITE_BOLD_CLOSE} or [white]-GNinja[/white]")
+            console.print("  • Several at once: separate with spaces → Example: [white]1=ON 4=ON -GNinja[/white]")
+            console.print(f"  • Type {Style.WHITE_BOLD_OPEN}done{Style.WHITE_BOLD_CLOSE} when finished\n")
             
             # Collect custom options
             user_input = Prompt.ask(
-                f"[{Style.WARNING}]Enter option (number or name) or 'done'[/{Style.WARNING}]",
+                f"{Style.WARNING_OPEN}Enter option (number or name) or 'done'{Style.WARNING_CLOSE}",
                 default=""
             ).strip()
             
@@ -617,145 +888,85 @@ class TeemakeBuilder:
                 # User is done customizing
                 break
             
-            # Parse the input
-            if '=' in user_input:
-                option_part, value = user_input.split('=', 1)
-                option_part = option_part.strip()
-                value = value.strip()
+            # Apply every edit in the input before the next redraw
+            had_error = False
+            finished = False
+            for match in self._OPTION_EDIT_RE.finditer(user_input):
+                option_part, value, token = match.group("name", "value", "token")
+                value = value or ""
                 
-                # Check if it's a number
-                if option_part.isdigit():
-                    idx = int(option_part)
-                    if 1 <= idx <= len(available_options):
+                if option_part is not None:
+                    
+                    # Check if it's a number, otherwise it's an option name (like -DMYSQL)
+                    if option_part.isdigit():
+                        idx = int(option_part)
+                        if not 1 <= idx <= len(available_options):
+                            console.print(f"{Style.ERROR_OPEN}Invalid option number {idx}. Must be 1-{len(available_options)}{Style.ERROR_CLOSE}")
+                            had_error = True
+                            continue
                         opt = available_options[idx - 1]
-                        
-                        if opt.option_type == "generator":
-                            # Handle generator options (like -GNinja)
-                            if value.upper() in ["ON", "YES", "TRUE", "1"]:
-                                current_options[opt.name] = "ON"
-                                if opt.name == "-GNinja":
-                                    use_ninja = True
-                                console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = ON[/{Style.SUCCESS}]")
-                            else:
-                                current_options[opt.name] = "OFF"
-                                if opt.name == "-GNinja":
-                                    use_ninja = False
-                                console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = OFF[/{Style.SUCCESS}]")
-                        
-                        elif opt.option_type == "boolean":
-                            # Validate boolean values
-                            if value.upper() not in ["ON", "OFF", "YES", "NO", "TRUE", "FALSE", "1", "0"]:
-                                console.print(
-                                    f"[{Style.ERROR}]Invalid boolean value. Use ON/OFF, YES/NO, TRUE/FALSE, or 1/0[/{Style.ERROR}]"
-                                )
-                                console.print(f"[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-                                input()
-                                continue
-                            
-                            # Normalize to ON/OFF
-                            normalized = "ON" if value.upper() in ["ON", "YES", "TRUE", "1"] else "OFF"
-                            current_options[opt.name] = normalized
-                            console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = {normalized}[/{Style.SUCCESS}]")
-                        
-                        else:
-                            # String type
-                            current_options[opt.name] = value
-                            console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = {value}[/{Style.SUCCESS}]")
-                        
-                        # Brief pause to show message
-                        import time
-                        time.sleep(0.5)
                     else:
-                        console.print(f"[{Style.ERROR}]Invalid option number. Must be 1-{len(available_options)}[/{Style.ERROR}]")
-                        console.print(f"[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-                        input()
+                        opt = options_by_name.get(option_part)
+                        if opt is None:
+                            console.print(
+                                f"{Style.WARNING_OPEN}Warning: {escape(option_part)} is not in the standard options list{Style.WARNING_CLOSE}"
+                            )
+                            had_error = True
+                            continue
+                    
+                    if not self._apply_option(opt, value, current_options):
+                        had_error = True
+                        continue
+                    
+                    last_actions.append(f"✓ Set {opt.name} = {current_options[opt.name]}")
+                
+                elif token.lower() == "done":
+                    # Finish once the rest of the batch has been applied
+                    finished = True
+                
+                elif token == "-GNinja":
+                    # Toggle Ninja on
+                    current_options["-GNinja"] = "ON"
+                    last_actions.append("✓ Enabled Ninja generator")
                 
                 else:
-                    # It's an option name (like -DMYSQL)
-                    option_exists = False
-                    for opt in available_options:
-                        if opt.name == option_part:
-                            option_exists = True
-                            
-                            if opt.option_type == "generator":
-                                # Handle generator options
-                                if value.upper() in ["ON", "YES", "TRUE", "1"]:
-                                    current_options[opt.name] = "ON"
-                                    if opt.name == "-GNinja":
-                                        use_ninja = True
-                                    console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = ON[/{Style.SUCCESS}]")
-                                else:
-                                    current_options[opt.name] = "OFF"
-                                    if opt.name == "-GNinja":
-                                        use_ninja = False
-                                    console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = OFF[/{Style.SUCCESS}]")
-                            
-                            elif opt.option_type == "boolean":
-                                if value.upper() not in ["ON", "OFF", "YES", "NO", "TRUE", "FALSE", "1", "0"]:
-                                    console.print(
-                                        f"[{Style.ERROR}]Invalid boolean value. Use ON/OFF[/{Style.ERROR}]"
-                                    )
-                                    console.print(f"[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-                                    input()
-                                    continue
-                                
-                                normalized = "ON" if value.upper() in ["ON", "YES", "TRUE", "1"] else "OFF"
-                                current_options[opt.name] = normalized
-                                console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = {normalized}[/{Style.SUCCESS}]")
-                            
-                            else:
-                                current_options[opt.name] = value
-                                console.print(f"[{Style.SUCCESS}]✓ Set {opt.name} = {value}[/{Style.SUCCESS}]")
-                            
-                            import time
-                            time.sleep(0.5)
-                            break
-                    
-                    if not option_exists:
-                        console.print(
-                            f"[{Style.WARNING}]Warning: {option_part} is not in the standard options list[/{Style.WARNING}]"
-                        )
-                        console.print(f"[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-                        input()
+                    console.print(
+                        f"{Style.ERROR_OPEN}Invalid format '{escape(token)}'. Use <#>=<value>, <option>=<value>, or 'done'{Style.ERROR_CLOSE}"
+                    )
+                    console.print(f"{Style.INFO_OPEN}Examples: 1=ON, -DMYSQL=ON, -GNinja, done{Style.INFO_CLOSE}")
+                    had_error = True
             
-            elif user_input == "-GNinja":
-                # Toggle Ninja on
-                current_options["-GNinja"] = "ON"
-                use_ninja = True
-                console.print(f"[{Style.SUCCESS}]✓ Enabled Ninja generator[/{Style.SUCCESS}]")
-                import time
-                time.sleep(0.5)
+            if had_error:
+                self._pause("\nPress Enter to continue...")
             
-            else:
-                console.print(
-                    f"[{Style.ERROR}]Invalid format. Use <#>=<value>, <option>=<value>, or 'done'[/{Style.ERROR}]"
-                )
-                console.print(f"[{Style.INFO}]Examples: 1=ON, -DMYSQL=ON, -GNinja, done[/{Style.INFO}]")
-                console.print(f"\n[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-                input()
+            if finished:
+                break
+        
+        use_ninja = current_options.get("-GNinja") == "ON"
         
-        # Build final command with changed options only
+        # Build final command with changed options only, noting whether the
+        # client/server switches were set explicitly
         custom_options: List[str] = []
+        has_client = has_server = False
         
         for opt in available_options:
-            current_val = current_options.get(opt.name, opt.current_value)
+            current_val = current_options[opt.name]
             
-            # Only add if changed from default OR if it's a critical option
-            if current_val != opt.current_value:
-                if opt.option_type == "generator":
-                    if current_val == "ON":
-                        custom_options.append(opt.name)
-                else:
-                    custom_options.append(f"{opt.name}={current_val}")
+            # Generators must always be passed explicitly, other options only
+            # if changed from CMake's default
+            if opt.option_type == "generator":
+                if current_val == "ON":
+                    custom_options.append(opt.name)
+            elif current_val != opt.current_value:
+                custom_options.append(f"{opt.name}={current_val}")
+                has_client |= opt.name == "-DCLIENT"
+                has_server |= opt.name == "-DSERVER"
         
         if custom_options:
             # Build command: cmake ../source/ [custom_options]
             build_command = ["cmake", "../source/"] + custom_options
             
             # Always add -DCLIENT=OFF and -DSERVER=ON if not already set
-            has_client = any('-DCLIENT' in opt for opt in custom_options)
-            has_server = any('-DSERVER' in opt for opt in custom_options)
-            
             if not has_client:
                 build_command.append("-DCLIENT=OFF")
             if not has_server:
@@ -763,42 +974,84 @@ class TeemakeBuilder:
             
             return build_command, use_ninja
         else:
-            console.print(f"\n[{Style.INFO}]No changes made, using defaults[/{Style.INFO}]")
-            console.print(f"\n[{Style.INFO}]Press Enter to continue...[/{Style.INFO}]")
-            input()
-            return self.selected_mode.build_opts.copy(), False
+            if ninja_available:
+                # Only the Ninja default was switched off
+                console.print(f"\n{Style.INFO_OPEN}Ninja disabled, using the default options with Make{Style.INFO_CLOSE}")
+            else:
+                console.print(f"\n{Style.INFO_OPEN}No changes made, using defaults{Style.INFO_CLOSE}")
+            self._pause("\nPress Enter to continue...")
+            return self.selected_mode.build_opts, False
+    
+    def _apply_option(self, opt: BuildOption, value: str, current_options: Dict[str, str]) -> bool:
+        """
+        Apply a user-entered value to a build option
+        
+        Args:
+            opt: Build option being changed
+            value: Raw value entered by the user
+            current_options: Option name -> current value mapping to update
+            
+        Returns:
+            True if the value was applied, False if it was invalid
+        """
+        if opt.option_type == "generator":
+            # Generators (like -GNinja) are either present or not
+            normalized = "ON" if _normalize_bool(value) == "ON" else "OFF"
+        elif opt.option_type == "boolean":
+            normalized = _normalize_bool(value)
+            if normalized is None:
+                console.print(
+                    f"{Style.ERROR_OPEN}Invalid boolean value. Use ON/OFF, YES/NO, TRUE/FALSE, or 1/0{Style.ERROR_CLOSE}"
+                )
+                return False
+        else:
+            # String type
+            normalized = value
+        
+        current_options[opt.name] = normalized
+        return True
     
-    def _get_install_command(self, dependencies: str) -> Optional[List[str]]:
+    def _get_install_command(self, dependencies: Sequence[str]) -> Optional[List[str]]:
         """
         Get the appropriate install command for detected package manager
         
         Args:
-            dependencies: Space-separated list of dependencies
+            dependencies: Packages to install
             
         Returns:
             Command list or None if unsupported
         """
-        if self.package_manager == PackageManager.APT:
-            cmd_prefix = ["sudo", "apt-get", "install", "-y"] if not self.is_root else ["apt-get", "install", "-y"]
-            return cmd_prefix + dependencies.split()
+        spec = self._INSTALL_CMDS.get(self.package_manager)
+        if spec is None:
+            return None
         
-        elif self.package_manager == PackageManager.DNF:
-            cmd_prefix = ["sudo", "dnf", "install", "-y"] if not self.is_root else ["dnf", "install", "-y"]
-            return cmd_prefix + dependencies.split()
+        cmd_prefix, needs_sudo = spec
+        sudo = ["sudo"] if needs_sudo and not self.is_root else []
+        return sudo + list(cmd_prefix) + list(dependencies)
+    
+    def _mode_dependencies(self) -> Tuple[str, ...]:
+        """
+        Base and game mode packages for the detected package manager
+        
+        The list is split once per game mode and reused afterwards.
         
-        elif self.package_manager == PackageManager.YUM:
-            cmd_prefix = ["sudo", "yum", "install", "-y"] if not self.is_root else ["yum", "install", "-y"]
-            return cmd_prefix + dependencies.split()
+        Returns:
+            Package names to install
+        """
+        cached = self._deps_by_mode.get(self.selected_mode.name)
+        if cached is not None:
+            return cached
         
-        elif self.package_manager == PackageManager.PACMAN:
-            cmd_prefix = ["sudo", "pacman", "-S", "--noconfirm"] if not self.is_root else ["pacman", "-S", "--noconfirm"]
-            return cmd_prefix + dependencies.split()
+        pm_value = self.package_manager.value
         
-        elif self.package_manager == PackageManager.ZYPPER:
-            cmd_prefix = ["sudo", "zypper", "install", "-y"] if not self.is_root else ["zypper", "install", "-y"]
-            return cmd_prefix + dependencies.split()
+        # Base and game mode packages, falling back to the apt-get names
+        base_deps = self.BASE_DEPS.get(pm_value) or self.BASE_DEPS.get("apt-get", "")
+        mode_deps = (self.selected_mode.dependencies.get(pm_value)
+                     or self.selected_mode.dependencies.get("apt-get", ""))
         
-        return None
+        deps = tuple(base_deps.split() + mode_deps.split())
+        self._deps_by_mode[self.selected_mode.name] = deps
+        return deps
     
     def install_dependencies(self, use_ninja: bool = False) -> bool:
         """
@@ -814,8 +1067,8 @@ class TeemakeBuilder:
         
         if self.package_manager == PackageManager.UNKNOWN:
             console.print(
-                f"[{Style.ERROR}]✗ Unsupported package manager. "
-                f"Please install dependencies manually:[/{Style.ERROR}]"
+                f"{Style.ERROR_OPEN}✗ Unsupported package manager. "
+                f"Please install dependencies manually:{Style.ERROR_CLOSE}"
             )
             # Show APT dependencies as example
             deps_to_show = f"{self.BASE_DEPS.get('apt-get', '')} {self.selected_mode.dependencies.get('apt-get', '')}"
@@ -824,37 +1077,21 @@ class TeemakeBuilder:
             console.print(f"  Example (APT): {deps_to_show}")
             
             if not Confirm.ask(
-                f"\n[{Style.WARNING}]Continue anyway? (dependencies must be installed)[/{Style.WARNING}]"
+                f"\n{Style.WARNING_OPEN}Continue anyway? (dependencies must be installed){Style.WARNING_CLOSE}"
             ):
                 return False
             return True
         
-        # Get base dependencies for this package manager
-        base_deps = self.BASE_DEPS.get(pm_value, self.BASE_DEPS.get("apt-get", ""))
-        
-        # Get game mode dependencies for this package manager
-        mode_deps = self.selected_mode.dependencies.get(pm_value, 
-                                                        self.selected_mode.dependencies.get("apt-get", ""))
-        
-        # Combine dependencies
-        all_deps = f"{base_deps} {mode_deps}"
+        all_deps = list(self._mode_dependencies())
         
         # Add ninja if needed
         if use_ninja:
-            ninja_packages = {
-                "apt-get": "ninja-build",
-                "dnf": "ninja-build",
-                "yum": "ninja-build",
-                "pacman": "ninja",
-                "zypper": "ninja",
-            }
-            ninja_pkg = ninja_packages.get(pm_value, "ninja-build")
-            all_deps += f" {ninja_pkg}"
+            all_deps.append(self.NINJA_PACKAGES.get(pm_value, "ninja-build"))
         
         install_cmd = self._get_install_command(all_deps)
         
         if not install_cmd:
-            console.print(f"[{Style.ERROR}]Failed to create install command[/{Style.ERROR}]")
+            console.print(f"{Style.ERROR_OPEN}Failed to create install command{Style.ERROR_CLOSE}")
             return False
         
         success, _, _ = self.run_command(
@@ -875,29 +1112,106 @@ class TeemakeBuilder:
         Returns:
             True if successful
         """
+        # Reuse a checkout of the same repository left by a previous run
+        if (source_path / ".git").exists():
+            try:
+                result = subprocess.run(
+                    ["git", "config", "--get", "remote.origin.url"],
+                    cwd=source_path,
+                    capture_output=True,
+                    text=True
+                )
+            except OSError:
+                result = None
+            if result is not None and result.returncode == 0 and result.stdout.strip() == self.selected_mode.url:
+                console.print(
+                    f"{Style.SUCCESS_OPEN}✓ Reusing existing {self.selected_mode.name} source{Style.SUCCESS_CLOSE}"
+                )
+                # A previous run may have stopped before all submodules were fetched
+                success, _, _ = self.run_command(
+                    "Updating submodules",
+                    ["git", "submodule", "update", "--init", "--recursive"],
+                    shell=False,
+                    cwd=source_path,
+                    capture=False
+                )
+                return success
+        
+        # Only a directory we start out empty may be wiped for the fallback clone
+        was_empty = not any(source_path.iterdir())
+        
+        # History is not needed to build, so fetch a single commit per repository
+        # and clone submodules in parallel
+        jobs = min(os.cpu_count() or 4, 8)
         success, _, _ = self.run_command(
             f"Downloading {self.selected_mode.name}",
-            ["git", "clone", "--recursive", self.selected_mode.url, "."],
+            [
+                "git", "clone", "--depth=1", "--single-branch",
+                "--recurse-submodules", "--shallow-submodules", f"--jobs={jobs}",
+                self.selected_mode.url, "."
+            ],
             shell=False,
-            cwd=source_path
+            cwd=source_path,
+            capture=False
         )
         
+        if not success and was_empty:
+            # Some remotes reject shallow fetches, retry with a full clone
+            console.print(
+                f"{Style.WARNING_OPEN}Shallow clone failed, retrying with full history{Style.WARNING_CLOSE}"
+            )
+            for entry in source_path.iterdir():
+                if entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry)
+                else:
+                    entry.unlink()
+            
+            success, _, _ = self.run_command(
+                f"Downloading {self.selected_mode.name}",
+                ["git", "clone", "--recursive", self.selected_mode.url, "."],
+                shell=False,
+                cwd=source_path,
+                capture=False
+            )
+        
         if not success:
             return False
         
         # Validate git clone success
         if not (source_path / ".git").exists():
             console.print(
-                f"[{Style.ERROR}]✗ Git repository not properly cloned[/{Style.ERROR}]"
+                f"{Style.ERROR_OPEN}✗ Git repository not properly cloned{Style.ERROR_CLOSE}"
             )
             return False
         
         console.print(
-            f"[{Style.SUCCESS}]✓ Repository validated[/{Style.SUCCESS}]"
+            f"{Style.SUCCESS_OPEN}✓ Repository validated{Style.SUCCESS_CLOSE}"
         )
         return True
     
-    def configure_build(self, build_path: Path, build_opts: List[str]) -> bool:
+    def _with_compiler_launcher(self, build_opts: Sequence[str]) -> List[str]:
+        """
+        Add ccache as the compiler launcher when it is installed
+        
+        Args:
+            build_opts: CMake command line
+            
+        Returns:
+            CMake command line, with ccache launcher options if available
+        """
+        command = list(build_opts)
+        if not self._tools["ccache"]:
+            return command
+        
+        for var in ("CMAKE_C_COMPILER_LAUNCHER", "CMAKE_CXX_COMPILER_LAUNCHER"):
+            # Respect a launcher the user configured explicitly
+            if not any(opt.startswith(f"-D{var}") for opt in command):
+                command.append(f"-D{var}=ccache")
+        
+        self.logger.debug("Using ccache as compiler launcher")
+        return command
+    
+    def configure_build(self, build_path: Path, build_opts: Sequence[str]) -> bool:
         """
         Configure the build system
         
@@ -908,15 +1222,76 @@ class TeemakeBuilder:
         Returns:
             True if successful
         """
+        command = self._with_compiler_launcher(build_opts)
+        
+        # Skip CMake's feature probes when this exact configuration already ran
+        # for the same source repository
+        hash_path = build_path / self.CONFIGURE_HASH_FILE
+        opts_hash = hashlib.sha256(
+            "\0".join([self.selected_mode.url, *command]).encode()
+        ).hexdigest()
+        try:
+            if (build_path / "CMakeCache.txt").exists() and hash_path.read_text().strip() == opts_hash:
+                console.print(
+                    f"{Style.SUCCESS_OPEN}✓ Build system already configured with these options{Style.SUCCESS_CLOSE}"
+                )
+                return True
+        except OSError:
+            pass
+        
+        # Drop the old stamp first so a failed or interrupted configure is not
+        # mistaken for a finished one on the next run
+        try:
+            hash_path.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.debug(f"Could not remove configure stamp: {e}")
+        
         success, _, _ = self.run_command(
             "Initializing build system",
-            build_opts,
+            command,
             shell=False,
             cwd=build_path
         )
         
+        if success:
+            try:
+                hash_path.write_text(opts_hash + "\n")
+            except OSError as e:
+                self.logger.debug(f"Could not record configure options: {e}")
+        
         return success
     
+    def _build_jobs(self) -> int:
+        """
+        Number of parallel build jobs for make or ninja
+        
+        Uses TEEMAKE_JOBS if set, otherwise the number of CPUs this process
+        may run on (which respects cpuset/taskset limits). When psutil is
+        installed the count is capped at roughly one job per free GB of
+        memory, as C++ compile jobs can each take about that much.
+        
+        Returns:
+            Job count (at least 1)
+        """
+        try:
+            jobs = len(os.sched_getaffinity(0))
+        except AttributeError:
+            # sched_getaffinity is not available on every platform
+            jobs = os.cpu_count() or 2
+        
+        env_jobs = os.environ.get("TEEMAKE_JOBS")
+        if env_jobs:
+            try:
+                return max(int(env_jobs), 1)
+            except ValueError:
+                self.logger.warning(f"Ignoring invalid TEEMAKE_JOBS value: {env_jobs}")
+        
+        if psutil is not None:
+            mem_jobs = psutil.virtual_memory().available // (1 << 30)
+            jobs = min(jobs, max(mem_jobs, 1))
+        
+        return jobs
+    
     def compile_server(self, build_path: Path, use_ninja: bool = False) -> bool:
         """
         Compile the server binary
@@ -928,23 +1303,24 @@ class TeemakeBuilder:
         Returns:
             True if successful
         """
+        cores = self._build_jobs()
+        
         if use_ninja:
-            # Use ninja instead of make
+            # Use ninja instead of make, with the same job limit
             success, _, _ = self.run_command(
-                "Compiling binary with Ninja",
-                ["ninja"],
+                f"Compiling binary with Ninja (using {cores} cores)",
+                ["ninja", f"-j{cores}"],
                 shell=False,
-                cwd=build_path
+                cwd=build_path,
+                capture=False
             )
         else:
-            # Limit cores to reasonable max for make
-            cores = min(os.cpu_count() or 2, 16)
-            
             success, _, _ = self.run_command(
                 f"Compiling binary (using {cores} cores)",
                 ["make", f"-j{cores}"],
                 shell=False,
-                cwd=build_path
+                cwd=build_path,
+                capture=False
             )
         
         return success
@@ -960,14 +1336,14 @@ class TeemakeBuilder:
             True if configuration completed (or skipped)
         """
         self.clear_screen()
-        console.print(f"[{Style.INFO} {Style.BOLD}]Server Configuration[/{Style.INFO} {Style.BOLD}]\n")
+        console.print(f"{Style.INFO_BOLD_OPEN}Server Configuration{Style.INFO_BOLD_CLOSE}\n")
         
         # Ask user for configuration type
-        console.print(f"[white {Style.BOLD}]Choose Configuration Type:[/white {Style.BOLD}]\n")
+        console.print(f"{Style.WHITE_BOLD_OPEN}Choose Configuration Type:{Style.WHITE_BOLD_CLOSE}\n")
         
-        table = Table(show_header=True, header_style=f"{Style.INFO} {Style.BOLD}", box=box.ROUNDED)
+        table = Table(show_header=True, header_style=Style.INFO_BOLD, box=box.ROUNDED)
         table.add_column("#", style=Style.INFO, width=4)
-        table.add_column("Type", style=f"white {Style.BOLD}")
+        table.add_column("Type", style=Style.WHITE_BOLD)
         table.add_column("Description", style=Style.DIM)
         
         config_options = [
@@ -984,7 +1360,7 @@ class TeemakeBuilder:
         
         while True:
             choice = Prompt.ask(
-                f"[{Style.WARNING}]Select configuration type (1-3)[/{Style.WARNING}]",
+                f"{Style.WARNING_OPEN}Select configuration type (1-3){Style.WARNING_CLOSE}",
                 default="1"
             )
             
@@ -994,21 +1370,21 @@ class TeemakeBuilder:
                     return self._basic_configuration(build_path)
                 elif idx == 2:
                     console.print(
-                        f"[{Style.WARNING}]Advanced configuration is not yet implemented.[/{Style.WARNING}]"
+                        f"{Style.WARNING_OPEN}Advanced configuration is not yet implemented.{Style.WARNING_CLOSE}"
                     )
                     console.print(
-                        f"[{Style.INFO}]Falling back to basic configuration...[/{Style.INFO}]\n"
+                        f"{Style.INFO_OPEN}Falling back to basic configuration...{Style.INFO_CLOSE}\n"
                     )
                     return self._basic_configuration(build_path)
                 elif idx == 3:
                     console.print(
-                        f"[{Style.INFO}]Skipping configuration - server will use default settings.[/{Style.INFO}]"
+                        f"{Style.INFO_OPEN}Skipping configuration - server will use default settings.{Style.INFO_CLOSE}"
                     )
                     return True
                 else:
-                    console.print(f"[{Style.ERROR}]Invalid choice. Please select 1-3.[/{Style.ERROR}]")
+                    console.print(f"{Style.ERROR_OPEN}Invalid choice. Please select 1-3.{Style.ERROR_CLOSE}")
             except ValueError:
-                console.print(f"[{Style.ERROR}]Invalid input. Please enter a number.[/{Style.ERROR}]")
+                console.print(f"{Style.ERROR_OPEN}Invalid input. Please enter a number.{Style.ERROR_CLOSE}")
     
     def _basic_configuration(self, build_path: Path) -> bool:
         """
@@ -1021,11 +1397,11 @@ class TeemakeBuilder:
             True if configuration saved successfully
         """
         # Get settings for current game mode
-        settings = self.BASIC_CONFIG_SETTINGS.get(self.selected_mode.name, [])
+        settings = self.BASIC_CONFIG_SETTINGS.get(self.selected_mode.name, ())
         
         if not settings:
             console.print(
-                f"[{Style.ERROR}]No configuration settings found for {self.selected_mode.name}[/{Style.ERROR}]"
+                f"{Style.ERROR_OPEN}No configuration settings found for {self.selected_mode.name}{Style.ERROR_CLOSE}"
             )
             return False
         
@@ -1033,49 +1409,34 @@ class TeemakeBuilder:
         
         while True:
             self.clear_screen()
-            console.print(f"[{Style.INFO} {Style.BOLD}]Basic Configuration[/{Style.INFO} {Style.BOLD}]\n")
+            console.print(f"{Style.INFO_BOLD_OPEN}Basic Configuration{Style.INFO_BOLD_CLOSE}\n")
             
             # Collect configuration values
-            console.print(f"[{Style.INFO}]Enter configuration values:[/{Style.INFO}]\n")
+            console.print(f"{Style.INFO_OPEN}Enter configuration values:{Style.INFO_CLOSE}\n")
             
             for setting in settings:
                 while True:
-                    prompt_text = f"[{Style.WARNING}]{setting.prompt}[/{Style.WARNING}]"
+                    prompt_text = f"{Style.WARNING_OPEN}{setting.prompt}{Style.WARNING_CLOSE}"
                     if setting.description:
-                        console.print(f"  [{Style.DIM}]{setting.description}[/{Style.DIM}]")
+                        console.print(f"  {Style.DIM_OPEN}{setting.description}{Style.DIM_CLOSE}")
                     
                     value = Prompt.ask(
                         prompt_text,
                         default=setting.default
                     )
                     
-                    # Basic validation for port
-                    if setting.key == "sv_port":
+                    if setting.validator:
+                        value_type, low, high = setting.validator
                         try:
-                            port = int(value)
-                            if port < 1024 or port > 65535:
-                                console.print(
-                                    f"[{Style.ERROR}]Port must be between 1024 and 65535[/{Style.ERROR}]"
-                                )
-                                continue
+                            typed_value = value_type(value)
                         except ValueError:
                             console.print(
-                                f"[{Style.ERROR}]Port must be a valid number[/{Style.ERROR}]"
+                                f"{Style.ERROR_OPEN}{setting.prompt} must be a valid number{Style.ERROR_CLOSE}"
                             )
                             continue
-                    
-                    # Basic validation for max_clients
-                    if setting.key == "sv_max_clients":
-                        try:
-                            clients = int(value)
-                            if clients < 1 or clients > 256:
-                                console.print(
-                                    f"[{Style.ERROR}]Max clients must be between 1 and 256[/{Style.ERROR}]"
-                                )
-                                continue
-                        except ValueError:
+                        if not low <= typed_value <= high:
                             console.print(
-                                f"[{Style.ERROR}]Max clients must be a valid number[/{Style.ERROR}]"
+                                f"{Style.ERROR_OPEN}{setting.prompt} must be between {low} and {high}{Style.ERROR_CLOSE}"
                             )
                             continue
                     
@@ -1085,10 +1446,10 @@ class TeemakeBuilder:
                 console.print()
             
             # Display entered configuration
-            console.print(f"[{Style.INFO} {Style.BOLD}]Configuration Summary:[/{Style.INFO} {Style.BOLD}]\n")
+            console.print(f"{Style.INFO_BOLD_OPEN}Configuration Summary:{Style.INFO_BOLD_CLOSE}\n")
             
-            summary_table = Table(show_header=True, header_style=f"{Style.INFO} {Style.BOLD}", box=box.ROUNDED)
-            summary_table.add_column("Setting", style=f"white {Style.BOLD}")
+            summary_table = Table(show_header=True, header_style=Style.INFO_BOLD, box=box.ROUNDED)
+            summary_table.add_column("Setting", style=Style.WHITE_BOLD)
             summary_table.add_column("Value", style=Style.INFO)
             
             for setting in settings:
@@ -1099,13 +1460,13 @@ class TeemakeBuilder:
             
             # Confirm values
             if Confirm.ask(
-                f"[{Style.WARNING}]Are these values correct?[/{Style.WARNING}]",
+                f"{Style.WARNING_OPEN}Are these values correct?{Style.WARNING_CLOSE}",
                 default=True
             ):
                 break
             else:
                 console.print(
-                    f"\n[{Style.INFO}]Let's re-enter the configuration...[/{Style.INFO}]\n"
+                    f"\n{Style.INFO_OPEN}Let's re-enter the configuration...{Style.INFO_CLOSE}\n"
                 )
                 config_values.clear()
         
@@ -1126,30 +1487,31 @@ class TeemakeBuilder:
         """
         config_path = build_path / filename
         
+        lines = [
+            "// Teeworlds Server Configuration\n",
+            "// Generated by TEEMAKE v3.0\n",
+            f"// Game Mode: {self.selected_mode.name}\n",
+            "\n",
+        ]
+        # Add quotes for string values, keep numbers unquoted
+        lines.extend(
+            f"{key} {value}\n" if key in _NUMERIC_CONFIG_KEYS else f'{key} "{value}"\n'
+            for key, value in config_values.items()
+        )
+        
         try:
-            with open(config_path, 'w') as f:
-                f.write("// Teeworlds Server Configuration\n")
-                f.write(f"// Generated by TEEMAKE v3.0\n")
-                f.write(f"// Game Mode: {self.selected_mode.name}\n")
-                f.write("\n")
-                
-                for key, value in config_values.items():
-                    # Add quotes for string values, keep numbers unquoted
-                    if key in ["sv_port", "sv_max_clients"]:
-                        f.write(f"{key} {value}\n")
-                    else:
-                        f.write(f'{key} "{value}"\n')
+            config_path.write_text("".join(lines), encoding="utf-8")
             
             console.print()
             console.print(
-                f"[{Style.SUCCESS}]✓ Configuration saved to: {config_path}[/{Style.SUCCESS}]"
+                f"{Style.SUCCESS_OPEN}✓ Configuration saved to: {config_path}{Style.SUCCESS_CLOSE}"
             )
             self.logger.info(f"Configuration saved to {config_path}")
             return True
             
         except Exception as e:
             console.print(
-                f"[{Style.ERROR}]✗ Failed to save configuration: {e}[/{Style.ERROR}]"
+                f"{Style.ERROR_OPEN}✗ Failed to save configuration: {e}{Style.ERROR_CLOSE}"
             )
             self.logger.error(f"Failed to save configuration: {e}")
             return False
@@ -1172,10 +1534,10 @@ class TeemakeBuilder:
         
         # Ask about verbose logging
         self.clear_screen()
-        console.print(f"[{Style.INFO} {Style.BOLD}]Step 4/5: Build Configuration[/{Style.INFO} {Style.BOLD}]\n")
+        console.print(f"{Style.INFO_BOLD_OPEN}Step 4/5: Build Configuration{Style.INFO_BOLD_CLOSE}\n")
         
         self.verbose = Confirm.ask(
-            f"[{Style.WARNING}]Show detailed build logs?[/{Style.WARNING}]",
+            f"{Style.WARNING_OPEN}Show detailed build logs?{Style.WARNING_CLOSE}",
         )
         
         # Update logging level if changed
@@ -1184,43 +1546,39 @@ class TeemakeBuilder:
         
         # Display build configuration summary
         self.clear_screen()
-        console.print(f"[{Style.INFO} {Style.BOLD}]Step 4/5: Configuration Summary[/{Style.INFO} {Style.BOLD}]\n")
+        console.print(f"{Style.INFO_BOLD_OPEN}Step 4/5: Configuration Summary{Style.INFO_BOLD_CLOSE}\n")
         console.print(Panel(
-            f"[white {Style.BOLD}]Server Name:[/white {Style.BOLD}] {self.server_name}\n"
-            f"[white {Style.BOLD}]Game Mode:[/white {Style.BOLD}] {self.selected_mode.name}\n"
-            f"[white {Style.BOLD}]Build System:[/white {Style.BOLD}] {'Ninja' if use_ninja else 'Make'}\n"
-            f"[white {Style.BOLD}]Package Manager:[/white {Style.BOLD}] {self.package_manager.value}\n"
-            f"[white {Style.BOLD}]Verbose Logs:[/white {Style.BOLD}] {'Yes' if self.verbose else 'No'}",
-            title=f"[{Style.INFO}]Build Configuration[/{Style.INFO}]",
+            f"{Style.WHITE_BOLD_OPEN}Server Name:{Style.WHITE_BOLD_CLOSE} {self.server_name}\n"
+            f"{Style.WHITE_BOLD_OPEN}Game Mode:{Style.WHITE_BOLD_CLOSE} {self.selected_mode.name}\n"
+            f"{Style.WHITE_BOLD_OPEN}Build System:{Style.WHITE_BOLD_CLOSE} {'Ninja' if use_ninja else 'Make'}\n"
+            f"{Style.WHITE_BOLD_OPEN}Package Manager:{Style.WHITE_BOLD_CLOSE} {self.package_manager.value}\n"
+            f"{Style.WHITE_BOLD_OPEN}Verbose Logs:{Style.WHITE_BOLD_CLOSE} {'Yes' if self.verbose else 'No'}",
+            title=f"{Style.INFO_OPEN}Build Configuration{Style.INFO_CLOSE}",
             border_style="purple"
         ))
         console.print()
         
         # Check disk space
         if not self.check_disk_space():
-            console.print(f"\n[{Style.INFO}]Press Enter to exit...[/{Style.INFO}]")
-            input()
+            self._pause("\nPress Enter to exit...")
             return None
         
         # Ensure sudo privileges (if not root)
         if not self.ensure_sudo():
-            console.print(f"\n[{Style.INFO}]Press Enter to exit...[/{Style.INFO}]")
-            input()
+            self._pause("\nPress Enter to exit...")
             return None
         
         console.print()
-        console.print(f"[{Style.INFO}]Press Enter to start building...[/{Style.INFO}]")
-        input()
+        self._pause("Press Enter to start building...")
         
         # Clear screen for build process
         self.clear_screen()
-        console.print(f"[{Style.INFO} {Style.BOLD}]Step 5/5: Building Server[/{Style.INFO} {Style.BOLD}]\n")
+        console.print(f"{Style.INFO_BOLD_OPEN}Step 5/5: Building Server{Style.INFO_BOLD_CLOSE}\n")
         
         # Install dependencies (including ninja if needed)
         if not self.install_dependencies(use_ninja):
-            console.print(f"[{Style.ERROR}]Failed to install dependencies[/{Style.ERROR}]")
-            console.print(f"\n[{Style.INFO}]Press Enter to exit...[/{Style.INFO}]")
-            input()
+            console.print(f"{Style.ERROR_OPEN}Failed to install dependencies{Style.ERROR_CLOSE}")
+            self._pause("\nPress Enter to exit...")
             return None
         
         # Create directory structure
@@ -1235,39 +1593,31 @@ class TeemakeBuilder:
             # Convert to absolute paths
             source_path = source_path.absolute()
             build_path = build_path.absolute()
-            start_dir = Path.cwd().absolute()
             
             self.logger.debug(f"Source path: {source_path}")
             self.logger.debug(f"Build path: {build_path}")
             
         except Exception as e:
-            console.print(f"[{Style.ERROR}]Failed to create directories: {e}[/{Style.ERROR}]")
+            console.print(f"{Style.ERROR_OPEN}Failed to create directories: {e}{Style.ERROR_CLOSE}")
             return None
         
-        # Use try/finally to ensure we return to original directory
-        try:
-            # Clone repository
-            if not self.clone_repository(source_path):
-                console.print(f"[{Style.ERROR}]Failed to download source code[/{Style.ERROR}]")
-                return None
-            
-            # Configure build with custom options
-            if not self.configure_build(build_path, custom_build_opts):
-                console.print(f"[{Style.ERROR}]Failed to initialize build[/{Style.ERROR}]")
-                return None
-            
-            # Compile with use_ninja flag
-            if not self.compile_server(build_path, use_ninja):
-                console.print(f"[{Style.ERROR}]Failed to compile[/{Style.ERROR}]")
-                return None
-            
-            # Return build_path for configuration
-            return build_path
-            
-        finally:
-            # Always return to starting directory
-            os.chdir(start_dir)
-            self.logger.debug(f"Returned to directory: {start_dir}")
+        # Clone repository
+        if not self.clone_repository(source_path):
+            console.print(f"{Style.ERROR_OPEN}Failed to download source code{Style.ERROR_CLOSE}")
+            return None
+        
+        # Configure build with custom options
+        if not self.configure_build(build_path, custom_build_opts):
+            console.print(f"{Style.ERROR_OPEN}Failed to initialize build{Style.ERROR_CLOSE}")
+            return None
+        
+        # Compile with use_ninja flag
+        if not self.compile_server(build_path, use_ninja):
+            console.print(f"{Style.ERROR_OPEN}Failed to compile{Style.ERROR_CLOSE}")
+            return None
+        
+        # Return build_path for configuration
+        return build_path
     
     def run(self) -> int:
         """
@@ -1283,51 +1633,50 @@ class TeemakeBuilder:
             
             if build_path:
                 self.clear_screen()
-                console.print(f"[{Style.SUCCESS} {Style.BOLD}]✓ BUILD COMPLETE![/{Style.SUCCESS} {Style.BOLD}]\n")
+                console.print(f"{Style.SUCCESS_BOLD_OPEN}✓ BUILD COMPLETE!{Style.SUCCESS_BOLD_CLOSE}\n")
                 console.print(Panel(
-                    f"Server build finished in: [white {Style.BOLD}]./{self.server_name}[/white {Style.BOLD}]",
+                    f"Server build finished in: {Style.WHITE_BOLD_OPEN}./{self.server_name}{Style.WHITE_BOLD_CLOSE}",
                     border_style=Style.SUCCESS,
                     box=box.ROUNDED
                 ))
                 console.print()
-                console.print(f"[{Style.INFO}]Press Enter to configure server...[/{Style.INFO}]")
-                input()
+                self._pause("Press Enter to configure server...")
                 
                 # Configure server
                 self.configure_server(build_path)
                 
                 # Final completion screen
                 self.clear_screen()
-                console.print(f"[{Style.SUCCESS} {Style.BOLD}]✓ Installation Complete![/{Style.SUCCESS} {Style.BOLD}]\n")
+                console.print(f"{Style.SUCCESS_BOLD_OPEN}✓ Installation Complete!{Style.SUCCESS_BOLD_CLOSE}\n")
                 console.print(Panel(
-                    f"[white]Server:[/white] [white {Style.BOLD}]{self.server_name}[/white {Style.BOLD}]\n"
-                    f"[white]Location:[/white] [white {Style.BOLD}]./{self.server_name}/server/[/white {Style.BOLD}]\n"
-                    f"[white]Config:[/white] [white {Style.BOLD}]basic_config.cfg[/white {Style.BOLD}]\n\n"
-                    f"[{Style.INFO}]To start your server:[/{Style.INFO}]\n"
-                    f"  [white {Style.BOLD}]cd {self.server_name}/server[/white {Style.BOLD}]\n"
-                    f"  [white {Style.BOLD}]./server_binary -f your_config.cfg[/white {Style.BOLD}]",
-                    title=f"[{Style.SUCCESS}]Ready to Launch[/{Style.SUCCESS}]",
+                    f"[white]Server:[/white] {Style.WHITE_BOLD_OPEN}{self.server_name}{Style.WHITE_BOLD_CLOSE}\n"
+                    f"[white]Location:[/white] {Style.WHITE_BOLD_OPEN}./{self.server_name}/server/{Style.WHITE_BOLD_CLOSE}\n"
+                    f"[white]Config:[/white] {Style.WHITE_BOLD_OPEN}basic_config.cfg{Style.WHITE_BOLD_CLOSE}\n\n"
+                    f"{Style.INFO_OPEN}To start your server:{Style.INFO_CLOSE}\n"
+                    f"  {Style.WHITE_BOLD_OPEN}cd {self.server_name}/server{Style.WHITE_BOLD_CLOSE}\n"
+                    f"  {Style.WHITE_BOLD_OPEN}./server_binary -f your_config.cfg{Style.WHITE_BOLD_CLOSE}",
+                    title=f"{Style.SUCCESS_OPEN}Ready to Launch{Style.SUCCESS_CLOSE}",
                     border_style=Style.SUCCESS,
                     box=box.DOUBLE
                 ))
-                console.print(f"\n[{Style.INFO}]Enjoy your Teeworlds server![/{Style.INFO}]\n")
+                console.print(f"\n{Style.INFO_OPEN}Enjoy your Teeworlds server!{Style.INFO_CLOSE}\n")
                 return 0
             else:
                 console.print()
                 console.print(
-                    f"[{Style.ERROR} {Style.BOLD}]Build failed. "
-                    f"Please check the errors above.[/{Style.ERROR} {Style.BOLD}]\n"
+                    f"{Style.ERROR_BOLD_OPEN}Build failed. "
+                    f"Please check the errors above.{Style.ERROR_BOLD_CLOSE}\n"
                 )
                 return 1
                 
         except KeyboardInterrupt:
             console.print(
-                f"\n\n[{Style.WARNING}]⚠  Build cancelled by user[/{Style.WARNING}]\n"
+                f"\n\n{Style.WARNING_OPEN}⚠  Build cancelled by user{Style.WARNING_CLOSE}\n"
             )
             return 130
         except Exception as e:
             console.print(
-                f"\n[{Style.ERROR} {Style.BOLD}]Unexpected error: {e}[/{Style.ERROR} {Style.BOLD}]\n"
+                f"\n{Style.ERROR_BOLD_OPEN}Unexpected error: {e}{Style.ERROR_BOLD_CLOSE}\n"
             )
             self.logger.exception("Unexpected error occurred")
             return 1